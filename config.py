@@ -2,17 +2,19 @@
 Konfiguracja aplikacji Portfolio Manager Pro
 """
 
+from types import MappingProxyType
+
 # Ustawienia językowe
 LANGUAGE = 'pl'  # Polski jako domyślny język
 LOCALE = 'pl_PL.UTF-8'
 
-# Ustawienia serwera
-SERVER_SPECS = {
+# Ustawienia serwera (tylko do odczytu - współdzielone bez kopiowania)
+SERVER_SPECS = MappingProxyType({
     'ram_gb': 64,
     'cores': 12,
     'threads': 24,
     'provider': 'Hetzner'
-}
+})
 
 # Ustawienia aplikacji
 APP_NAME = 'Portfolio Manager Pro'